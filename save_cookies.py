@@ -8,6 +8,19 @@ import asyncio
 import json
 from playwright.async_api import async_playwright
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json works, just slower
+    orjson = None
+
+# Login-success indicators as one comma-union selector, checked in a single query
+LOGIN_SEL = (
+    '[data-testid="AppTabBar_Home_Link"],'
+    '[data-testid="SideNav_AccountSwitcher_Button"],'
+    '[data-testid="primaryColumn"],'
+    '[aria-label="Home timeline"]'
+)
+
 async def save_twitter_cookies():
     """Launch browser, let user log in manually, then save cookies."""
     print("🍪 Twitter Cookie Saver")
@@ -43,32 +56,16 @@ async def save_twitter_cookies():
             current_url = page.url
             print(f"\n🔍 Current URL: {current_url}")
             
-            # Look for login success indicators
-            login_indicators = [
-                '[data-testid="AppTabBar_Home_Link"]',
-                '[data-testid="SideNav_AccountSwitcher_Button"]',
-                '[data-testid="primaryColumn"]',
-                '[aria-label="Home timeline"]'
-            ]
-            
-            logged_in = False
-            for indicator in login_indicators:
-                element = await page.query_selector(indicator)
-                if element:
-                    logged_in = True
-                    break
-            
+            # Look for login success indicators with a single union-selector query
+            logged_in = (await page.query_selector(LOGIN_SEL)) is not None
+
             if not logged_in and 'login' not in current_url:
                 # Try navigating to home to verify login
                 print("🏠 Verifying login by navigating to home...")
                 await page.goto('https://twitter.com/home')
                 await page.wait_for_timeout(3000)
-                
-                for indicator in login_indicators:
-                    element = await page.query_selector(indicator)
-                    if element:
-                        logged_in = True
-                        break
+
+                logged_in = (await page.query_selector(LOGIN_SEL)) is not None
             
             if not logged_in:
                 print("❌ Login verification failed.")
@@ -94,9 +91,18 @@ async def save_twitter_cookies():
                 print("⚠️  No Twitter-specific cookies found, saving all cookies instead...")
                 twitter_cookies = cookies
             
-            # Save cookies to file
-            with open('twitter_cookies.json', 'w') as f:
-                json.dump(twitter_cookies, f, indent=2)
+            # Save cookies to file, streaming one cookie at a time so peak
+            # memory stays at one serialized cookie, not the whole dump
+            with open('twitter_cookies.json', 'wb') as f:
+                f.write(b'[')
+                for i, cookie in enumerate(twitter_cookies):
+                    if i:
+                        f.write(b',')
+                    if orjson:
+                        f.write(orjson.dumps(cookie))
+                    else:
+                        f.write(json.dumps(cookie).encode())
+                f.write(b']')
             
             print(f"\n💾 Saved {len(twitter_cookies)} cookies to twitter_cookies.json")
             print("✨ You can now use scrape_liked_tweets.py!")
@@ -5,33 +5,201 @@ Scrapes liked tweets from Twitter/X using saved session cookies.
 """
 
 import os
+import re
+import atexit
 import asyncio
 import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json works, just slower
+    orjson = None
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright, Page, Browser
 from bs4 import BeautifulSoup
-import pytz
+from zoneinfo import ZoneInfo
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # ciso8601 is optional; fromisoformat works, just slower
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
 load_dotenv()
 
+# Relative timestamps like '15m', '2h', '3d'. Anchoring to the full string
+# keeps '2mo' (months) from matching as minutes.
+_REL_TS = re.compile(r'^(\d+)([mhd])$')
+_REL_TS_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+
+# Status ID out of hrefs like '/user/status/1234567890'
+_STATUS_ID = re.compile(r'/status/(\d+)')
+
+# Author handle inside the User-Name block, e.g. '@someuser'
+_HANDLE = re.compile(r'@\w+')
+
+# Logged-in indicators as one comma-union selector: a single query walks
+# the DOM once instead of one round-trip per indicator.
+_LOGIN_SEL = (
+    '[data-testid="AppTabBar_Home_Link"],'
+    '[data-testid="SideNav_AccountSwitcher_Button"],'
+    '[data-testid="primaryColumn"],'
+    '[aria-label="Home timeline"]'
+)
+
+# Shared Playwright/browser instances so repeated scrapes pay Chromium
+# startup cost only once. Each scrape still gets its own BrowserContext.
+# All handles (lock included) are bound to the event loop they were created
+# on; _owner_loop tracks it so a later asyncio.run() on a fresh loop drops
+# the stale handles and relaunches instead of failing mid-scrape.
+_pw = None
+_browser: Optional[Browser] = None
+_persistent_context = None
+_browser_lock = asyncio.Lock()
+_owner_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# On-disk Chromium profile reused across runs; keeps session cookies, HTTP
+# cache, and service workers warm. Must stay gitignored.
+PROFILE_DIR = '.pw_profile'
+
+_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Resource types the extractor never needs: img.src / video.poster are
+# DOM attributes and survive even when the bytes are never downloaded.
+_BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+async def _block_heavy_resources(context) -> None:
+    """Abort image/media/font/stylesheet fetches; the likes feed is
+    multi-MB of images we only ever read URLs from."""
+    await context.route(
+        '**/*',
+        lambda route: route.abort()
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+        else route.continue_()
+    )
+
+# Trim Chromium's footprint: no GPU, extensions, or background work. The
+# scraper never paints to a screen, so headless is the default; set
+# TWITTER_SCRAPER_HEADFUL=1 to watch the browser while debugging.
+_LAUNCH_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--no-first-run',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--mute-audio',
+]
+
+def _bind_to_current_loop() -> None:
+    """Invalidate cached handles created under a different event loop.
+
+    get_liked_tweets() runs each scrape in its own asyncio.run(), which
+    closes its loop on return. Playwright objects (and asyncio.Lock) are
+    unusable once their loop is gone, so a new loop starts from scratch.
+    The old driver process exits on its own when the dead loop's pipe
+    transport is garbage collected.
+    """
+    global _pw, _browser, _persistent_context, _browser_lock, _owner_loop
+    loop = asyncio.get_running_loop()
+    if _owner_loop is not loop:
+        _pw = None
+        _browser = None
+        _persistent_context = None
+        _browser_lock = asyncio.Lock()
+        _owner_loop = loop
+
+async def _get_playwright():
+    """Lazily start the shared Playwright driver."""
+    global _pw
+    if _pw is None:
+        _pw = await async_playwright().start()
+    return _pw
+
+async def _get_browser() -> Browser:
+    """Lazily launch a single long-lived browser."""
+    global _browser
+    _bind_to_current_loop()
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            pw = await _get_playwright()
+            _browser = await pw.chromium.launch(
+                headless=os.getenv('TWITTER_SCRAPER_HEADFUL') != '1',
+                args=_LAUNCH_ARGS
+            )
+    return _browser
+
+async def _get_persistent_context():
+    """Lazily launch the persistent-profile context shared across scrapes."""
+    global _persistent_context
+    _bind_to_current_loop()
+    async with _browser_lock:
+        if _persistent_context is None:
+            pw = await _get_playwright()
+            _persistent_context = await pw.chromium.launch_persistent_context(
+                PROFILE_DIR,
+                headless=os.getenv('TWITTER_SCRAPER_HEADFUL') != '1',
+                args=_LAUNCH_ARGS,
+                user_agent=_USER_AGENT
+            )
+            await _block_heavy_resources(_persistent_context)
+    return _persistent_context
+
+async def _close_browser() -> None:
+    """Shut down the shared browser, persistent context, and Playwright handle."""
+    global _pw, _browser, _persistent_context
+    if _persistent_context is not None:
+        await _persistent_context.close()
+        _persistent_context = None
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _pw is not None:
+        await _pw.stop()
+        _pw = None
+
+@atexit.register
+def _cleanup_browser():
+    if _browser is None and _persistent_context is None:
+        return
+    # The handles only work on the loop that created them; a fresh
+    # asyncio.run() here could never close them. If that loop is already
+    # closed (the usual case after asyncio.run-per-call usage), skip: the
+    # driver process exits with its dead pipe transport anyway.
+    if _owner_loop is None or _owner_loop.is_closed() or _owner_loop.is_running():
+        return
+    try:
+        _owner_loop.run_until_complete(_close_browser())
+    except Exception:
+        pass
+
 class TwitterScraper:
     def __init__(self):
-        self.timezone = pytz.timezone(os.getenv('TIMEZONE', 'America/New_York'))
+        self.timezone = ZoneInfo(os.getenv('TIMEZONE', 'America/New_York'))
         self.cookies_file = 'twitter_cookies.json'
     
     async def load_cookies(self, context) -> bool:
         """Load Twitter cookies from file."""
         try:
+            # A persistent profile keeps the session on disk; skip the file
+            # entirely once the auth cookie is already in the context.
+            existing = await context.cookies('https://twitter.com')
+            if any(cookie.get('name') == 'auth_token' for cookie in existing):
+                print("Using session already present in the browser profile.")
+                return True
+
             if not os.path.exists(self.cookies_file):
                 print(f"Cookie file {self.cookies_file} not found.")
                 print("Please run save_cookies.py first to generate session cookies.")
                 return False
             
-            with open(self.cookies_file, 'r') as f:
-                cookies = json.load(f)
-            
+            with open(self.cookies_file, 'rb') as f:
+                raw = f.read()
+            cookies = orjson.loads(raw) if orjson else json.loads(raw)
+
             if not cookies:
                 print("Cookie file is empty.")
                 return False
@@ -40,7 +208,8 @@ class TwitterScraper:
             print(f"Loaded {len(cookies)} cookies from {self.cookies_file}")
             return True
             
-        except json.JSONDecodeError:
+        except ValueError:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
             print(f"Cookie file {self.cookies_file} is malformed. Please regenerate it.")
             return False
         except Exception as e:
@@ -55,20 +224,8 @@ class TwitterScraper:
             if 'login' in current_url or 'flow/login' in current_url:
                 return False
             
-            # Look for logged-in indicators
-            login_indicators = [
-                '[data-testid="AppTabBar_Home_Link"]',
-                '[data-testid="SideNav_AccountSwitcher_Button"]',
-                '[data-testid="primaryColumn"]',
-                '[aria-label="Home timeline"]'
-            ]
-            
-            for indicator in login_indicators:
-                element = await page.query_selector(indicator)
-                if element:
-                    return True
-            
-            return False
+            # Look for logged-in indicators with a single union-selector query
+            return (await page.query_selector(_LOGIN_SEL)) is not None
             
         except Exception as e:
             print(f"Error checking login status: {e}")
@@ -78,18 +235,19 @@ class TwitterScraper:
         """Navigate to the likes page."""
         try:
             print("Navigating to likes page...")
-            await page.goto('https://twitter.com/i/likes', wait_until='networkidle')
-            await page.wait_for_timeout(3000)
-            
+            # 'networkidle' rarely fires on Twitter (constant telemetry XHRs),
+            # so wait for DOM readiness and then for actual content below.
+            await page.goto('https://twitter.com/i/likes', wait_until='domcontentloaded')
+
             # Check if we're still logged in
             if not await self.check_login_status(page):
                 print("Session expired. Please refresh your twitter_cookies.json file.")
                 print("Run save_cookies.py to get new session cookies.")
                 return False
-            
-            # Wait for tweets to load
+
+            # Wait for tweets (or the empty state, for accounts with no likes) to load
             try:
-                await page.wait_for_selector('article[data-testid="tweet"]', timeout=10000)
+                await page.wait_for_selector('article[data-testid="tweet"], [data-testid="emptyState"]', timeout=10000)
                 print("Likes page loaded successfully!")
                 return True
             except:
@@ -100,200 +258,300 @@ class TwitterScraper:
             print(f"Error navigating to likes: {e}")
             return False
     
-    async def scroll_and_load_tweets(self, page: Page, num_scrolls: int = 5) -> None:
-        """Scroll the page to load more tweets."""
+    def _oldest_timestamp(self, tweets: List[Dict]) -> Optional[datetime]:
+        """Oldest timestamp in a batch, or None if none carry one."""
+        timestamps = [t['timestamp'] for t in tweets if t.get('timestamp')]
+        return min(timestamps) if timestamps else None
+
+    async def scroll_and_extract(self, page: Page, num_scrolls: int = 5,
+                                 hours_filter: int = 24) -> List[Dict]:
+        """Scroll the page, extracting each tweet exactly once across scrolls.
+
+        Stops early once a batch reaches tweets older than hours_filter —
+        the feed is chronological, so anything further down would only be
+        filtered out again.
+        """
+        seen_ids: set = set()
+        cutoff_time = datetime.now(self.timezone) - timedelta(hours=hours_filter)
+
+        # Extract whatever rendered on the initial load
+        tweets = await self.extract_tweet_data(page, seen_ids)
+
+        oldest = self._oldest_timestamp(tweets)
+        if oldest is not None and oldest < cutoff_time:
+            print("Initial load already reaches past the cutoff; skipping scrolling.")
+            return tweets
+
         print(f"Scrolling to load more tweets ({num_scrolls} scrolls)...")
-        
+
         for i in range(num_scrolls):
+            # Remember how many tweets are rendered before scrolling
+            prev_count = len(await page.query_selector_all('article[data-testid="tweet"]'))
+
             # Scroll to bottom
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            
-            # Wait a bit for new content to load
-            await asyncio.sleep(2)
-            
+
+            # Wait until new tweets actually render instead of sleeping a fixed 2s
+            try:
+                await page.wait_for_function(
+                    f'document.querySelectorAll(\'article[data-testid="tweet"]\').length > {prev_count}',
+                    timeout=5000
+                )
+            except Exception:
+                # Timeout usually means we've hit the end of the feed
+                print("No new tweets appeared after scrolling; likely reached end of feed.")
+
+            # Only tweets not already collected get processed this round
+            batch = await self.extract_tweet_data(page, seen_ids)
+            tweets.extend(batch)
+
             print(f"Completed scroll {i + 1}/{num_scrolls}")
+
+            oldest = self._oldest_timestamp(batch)
+            if oldest is not None and oldest < cutoff_time:
+                print(f"Reached tweets older than {hours_filter}h; stopping early.")
+                break
+
+        return tweets
     
-    def parse_timestamp(self, time_text: str) -> Optional[datetime]:
-        """Parse relative timestamp like '2h', '1d', '3m' to datetime."""
+    def parse_timestamp(self, time_text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Parse relative timestamp like '2h', '1d', '3m' to datetime.
+
+        Callers processing a batch should pass a precomputed `now` so the
+        timezone lookup happens once per batch instead of once per tweet.
+        """
         if not time_text:
             return None
-            
-        now = datetime.now(self.timezone)
-        time_text = time_text.lower().strip()
-        
-        # Handle different time formats
-        if 'm' in time_text and time_text.replace('m', '').isdigit():
-            # Minutes ago
-            minutes = int(time_text.replace('m', ''))
-            return now - timedelta(minutes=minutes)
-        elif 'h' in time_text and time_text.replace('h', '').isdigit():
-            # Hours ago
-            hours = int(time_text.replace('h', ''))
-            return now - timedelta(hours=hours)
-        elif 'd' in time_text and time_text.replace('d', '').isdigit():
-            # Days ago
-            days = int(time_text.replace('d', ''))
-            return now - timedelta(days=days)
-        
+
+        if now is None:
+            now = datetime.now(self.timezone)
+        match = _REL_TS.match(time_text.lower().strip())
+
+        if match:
+            amount, unit = int(match.group(1)), match.group(2)
+            return now - timedelta(**{_REL_TS_UNITS[unit]: amount})
+
         # If we can't parse it, assume it's older than 24 hours
         return now - timedelta(days=2)
     
-    async def extract_tweet_data(self, page: Page) -> List[Dict]:
-        """Extract tweet data from the current page."""
+    def _rows_from_html(self, html: str) -> List[Dict]:
+        """Parse tweet rows from a full-page HTML snapshot with lxml."""
+        soup = BeautifulSoup(html, 'lxml')
+        rows = []
+
+        for article in soup.select('article[data-testid="tweet"]'):
+            text = article.select_one('[data-testid="tweetText"]')
+            social = article.select_one('[data-testid="socialContext"]')
+            author = article.select_one('[data-testid="User-Name"]')
+            link = article.select_one('a[href*="/status/"]')
+            time_el = article.select_one('time')
+            rows.append({
+                'text': text.get_text('\n') if text else '',
+                'social': social.get_text() if social else '',
+                'author': author.get_text('\n') if author else '',
+                'href': (link.get('href') or '') if link else '',
+                'datetime': (time_el.get('datetime') or '') if time_el else '',
+                'time_text': time_el.get_text() if time_el else '',
+                'images': [img.get('src') or '' for img in article.select('img[src*="media"]')],
+                'video_posters': [v['poster'] for v in article.select('video[poster]') if v.get('poster')]
+            })
+
+        return rows
+
+    async def extract_tweet_data(self, page: Page, seen_ids: Optional[set] = None) -> List[Dict]:
+        """Extract tweet data from the current page.
+
+        When seen_ids is given, tweets whose status ID is already in the set
+        are skipped and new IDs are added, so repeat extractions across
+        scrolls only process fresh articles.
+        """
         print("Extracting tweet data...")
-        
-        # Get all tweet articles
-        tweet_elements = await page.query_selector_all('article[data-testid="tweet"]')
+
+        # Grab the page HTML in one round-trip and parse locally via lxml;
+        # fall back to a single in-page evaluate if local parsing fails.
+        try:
+            rows = self._rows_from_html(await page.content())
+        except Exception as e:
+            print(f"Local HTML parse failed ({e}), falling back to in-page extraction.")
+            rows = await page.evaluate("""() =>
+                Array.from(document.querySelectorAll('article[data-testid="tweet"]')).map(article => {
+                    const text = article.querySelector('[data-testid="tweetText"]');
+                    const social = article.querySelector('[data-testid="socialContext"]');
+                    const author = article.querySelector('[data-testid="User-Name"]');
+                    const link = article.querySelector('a[href*="/status/"]');
+                    const time = article.querySelector('time');
+                    return {
+                        text: text ? text.textContent : '',
+                        social: social ? social.textContent : '',
+                        author: author ? author.textContent : '',
+                        href: (link && link.getAttribute('href')) || '',
+                        datetime: (time && time.getAttribute('datetime')) || '',
+                        time_text: time ? time.textContent : '',
+                        images: Array.from(article.querySelectorAll('img[src*="media"]')).map(img => img.src),
+                        video_posters: Array.from(article.querySelectorAll('video')).map(v => v.poster).filter(Boolean)
+                    };
+                })
+            """)
+
         tweets = []
-        
-        for element in tweet_elements:
+        now = datetime.now(self.timezone)  # one tz lookup for the whole batch
+        for row in rows:
             try:
+                # Skip tweets already extracted during an earlier scroll
+                if seen_ids is not None:
+                    id_match = _STATUS_ID.search(row['href'] or '')
+                    if id_match:
+                        if id_match.group(1) in seen_ids:
+                            continue
+                        seen_ids.add(id_match.group(1))
+
                 tweet_data = {}
-                
+
                 # Extract tweet text
-                text_element = await element.query_selector('[data-testid="tweetText"]')
-                if text_element:
-                    tweet_data['text'] = await text_element.inner_text()
-                else:
+                tweet_data['text'] = row['text']
+                if not tweet_data['text']:
                     continue  # Skip if no text found
-                
-                # Skip promoted tweets and retweets
-                if not tweet_data['text'] or 'Promoted' in tweet_data['text']:
+
+                # Skip promoted tweets
+                if 'Promoted' in tweet_data['text']:
                     continue
-                
-                # Check for retweet indicators
-                retweet_element = await element.query_selector('[data-testid="socialContext"]')
-                if retweet_element:
-                    retweet_text = await retweet_element.inner_text()
-                    if 'retweeted' in retweet_text.lower():
-                        continue  # Skip retweets
-                
-                # Extract author handle
-                author_element = await element.query_selector('[data-testid="User-Name"] span:has-text("@")')
-                if author_element:
-                    author_text = await author_element.inner_text()
-                    tweet_data['author_handle'] = author_text.strip()
-                else:
-                    tweet_data['author_handle'] = '@unknown'
-                
-                # Extract tweet link
-                link_element = await element.query_selector('a[href*="/status/"]')
-                if link_element:
-                    href = await link_element.get_attribute('href')
-                    if href.startswith('/'):
-                        tweet_data['url'] = f"https://twitter.com{href}"
-                    else:
-                        tweet_data['url'] = href
+
+                # Skip retweets
+                if 'retweeted' in row['social'].lower():
+                    continue
+
+                # Extract author handle from the User-Name block; regex search
+                # works whether or not the source text preserved line breaks
+                handle_match = _HANDLE.search(row['author'])
+                tweet_data['author_handle'] = handle_match.group(0) if handle_match else '@unknown'
+
+                # Extract tweet link; both extractors hand back strings, but
+                # guard anyway so a missing href can never raise mid-loop
+                href = row['href'] or ''
+                if href.startswith('/'):
+                    tweet_data['url'] = f"https://twitter.com{href}"
                 else:
-                    tweet_data['url'] = ''
-                
+                    tweet_data['url'] = href
+
                 # Extract timestamp
-                time_element = await element.query_selector('time')
-                if time_element:
-                    datetime_attr = await time_element.get_attribute('datetime')
-                    if datetime_attr:
-                        # Parse ISO timestamp
-                        tweet_data['timestamp'] = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
-                    else:
-                        # Fallback to relative time text
-                        time_text = await time_element.inner_text()
-                        tweet_data['timestamp'] = self.parse_timestamp(time_text)
+                if row['datetime']:
+                    # Parse ISO timestamp
+                    tweet_data['timestamp'] = _parse_iso(row['datetime'])
+                elif row['time_text']:
+                    # Fallback to relative time text
+                    tweet_data['timestamp'] = self.parse_timestamp(row['time_text'], now)
                 else:
                     tweet_data['timestamp'] = None
-                
+
                 # Extract media (images/videos)
                 media_urls = []
-                
-                # Look for images
-                img_elements = await element.query_selector_all('img[src*="media"]')
-                for img in img_elements:
-                    src = await img.get_attribute('src')
+                for src in row['images']:
                     if src and 'media' in src:
                         media_urls.append({
                             'type': 'image',
                             'url': src
                         })
-                
-                # Look for videos
-                video_elements = await element.query_selector_all('video')
-                for video in video_elements:
-                    poster = await video.get_attribute('poster')
-                    if poster:
-                        media_urls.append({
-                            'type': 'video',
-                            'preview_url': poster
-                        })
-                
+                for poster in row['video_posters']:
+                    media_urls.append({
+                        'type': 'video',
+                        'preview_url': poster
+                    })
+
                 tweet_data['media'] = media_urls
-                
+
                 tweets.append(tweet_data)
-                
+
             except Exception as e:
                 print(f"Error extracting tweet data: {e}")
                 continue
-        
+
         print(f"Extracted {len(tweets)} tweets")
         return tweets
     
     def filter_recent_tweets(self, tweets: List[Dict], hours: int = 24) -> List[Dict]:
         """Filter tweets to only include ones from the past N hours."""
         cutoff_time = datetime.now(self.timezone) - timedelta(hours=hours)
-        recent_tweets = []
-        
-        for tweet in tweets:
-            if tweet.get('timestamp'):
-                # Convert timestamp to timezone-aware datetime if needed
-                tweet_time = tweet['timestamp']
-                if tweet_time.tzinfo is None:
-                    tweet_time = self.timezone.localize(tweet_time)
-                
-                if tweet_time >= cutoff_time:
-                    recent_tweets.append(tweet)
-            else:
-                # If no timestamp, include it (better safe than sorry)
-                recent_tweets.append(tweet)
-        
+
+        # Extracted timestamps are always tz-aware (ISO attrs carry an offset
+        # and parse_timestamp anchors to self.timezone), so compare directly.
+        # Tweets without a timestamp are kept — better safe than sorry.
+        recent_tweets = [
+            tweet for tweet in tweets
+            if tweet.get('timestamp') is None or tweet['timestamp'] >= cutoff_time
+        ]
+
         print(f"Filtered to {len(recent_tweets)} tweets from the past {hours} hours")
         return recent_tweets
     
+    async def _scrape_in_context(self, context, num_scrolls: int, hours_filter: int) -> List[Dict]:
+        """Run one full scrape (cookies, navigation, scroll, extract) in a context."""
+        page = await context.new_page()
+
+        try:
+            # Load cookies
+            if not await self.load_cookies(context):
+                print("Failed to load cookies. Cannot proceed without authentication.")
+                return []
+
+            # Navigate to likes page (this will automatically use the loaded cookies)
+            if not await self.navigate_to_likes(page):
+                print("Failed to navigate to likes page or session expired.")
+                return []
+
+            # Scroll through the feed, extracting each tweet once and
+            # stopping as soon as the feed ages past the filter window
+            all_tweets = await self.scroll_and_extract(page, num_scrolls, hours_filter)
+
+            # Filter for recent tweets
+            return self.filter_recent_tweets(all_tweets, hours_filter)
+
+        finally:
+            await page.close()
+
     async def scrape_liked_tweets(self, num_scrolls: int = 5, hours_filter: int = 24) -> List[Dict]:
         """Main scraping function."""
-        async with async_playwright() as p:
-            # Launch browser with persistent context
-            browser = await p.chromium.launch(headless=False)  # Set to True for production
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-            
-            try:
-                # Load cookies
-                if not await self.load_cookies(context):
-                    print("Failed to load cookies. Cannot proceed without authentication.")
-                    return []
-                
-                # Navigate to likes page (this will automatically use the loaded cookies)
-                if not await self.navigate_to_likes(page):
-                    print("Failed to navigate to likes page or session expired.")
+        # The persistent profile keeps cookies and HTTP cache warm between
+        # runs, so repeat scrapes skip both cookie injection and cold loads.
+        context = await _get_persistent_context()
+
+        try:
+            return await self._scrape_in_context(context, num_scrolls, hours_filter)
+
+        except Exception as e:
+            print(f"Scraping error: {e}")
+            return []
+
+    async def scrape_many(self, jobs: List[Dict], max_concurrency: int = 4) -> List[List[Dict]]:
+        """
+        Run several scrapes concurrently, each in its own browser context.
+
+        Args:
+            jobs: List of dicts with optional 'num_scrolls' and 'hours_filter' keys
+            max_concurrency: Cap on simultaneous contexts (keep low to avoid anti-bot)
+
+        Returns:
+            One list of tweets per job, in job order.
+        """
+        browser = await _get_browser()
+        sem = asyncio.BoundedSemaphore(max_concurrency)
+
+        async def one(job: Dict) -> List[Dict]:
+            async with sem:
+                context = await browser.new_context(user_agent=_USER_AGENT)
+                await _block_heavy_resources(context)
+                try:
+                    return await self._scrape_in_context(
+                        context,
+                        job.get('num_scrolls', 5),
+                        job.get('hours_filter', 24)
+                    )
+                except Exception as e:
+                    print(f"Scraping error: {e}")
                     return []
-                
-                # Scroll to load more tweets
-                await self.scroll_and_load_tweets(page, num_scrolls)
-                
-                # Extract tweet data
-                all_tweets = await self.extract_tweet_data(page)
-                
-                # Filter for recent tweets
-                recent_tweets = self.filter_recent_tweets(all_tweets, hours_filter)
-                
-                return recent_tweets
-                
-            except Exception as e:
-                print(f"Scraping error: {e}")
-                return []
-            
-            finally:
-                await browser.close()
+                finally:
+                    await context.close()
+
+        return await asyncio.gather(*(one(job) for job in jobs))
 
 async def main():
     """Test the scraper."""
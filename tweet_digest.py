@@ -6,120 +6,437 @@ Sends daily, weekly, and monthly email digests of liked tweets.
 
 import os
 import sys
-import json
-import smtplib
+import time
+import asyncio
+import threading
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
-import pytz
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
-import calendar
+from html import escape as _esc
 
-load_dotenv()
+try:
+    import httpx
+except ImportError:  # httpx is optional; the requests-based path still works
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json works, just slower
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # ciso8601 is optional; fromisoformat works, just slower
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+from string import Template
+
+# Shared fallback for absent optional keys; avoids allocating a fresh
+# empty dict literal on every page for every .get("x", {}) site
+_EMPTY: Dict = {}
+
+# Email templates compiled once at import; the per-tweet block otherwise
+# gets re-parsed as an f-string for every tweet in the digest loop.
+_MEDIA_IMG_TPL = Template('<img src="$src" style="max-width: 100%; margin: 10px 0;" alt="$alt">')
+
+_TWEET_TPL = Template("""
+            <div style="border: 1px solid #e1e8ed; border-radius: 12px; padding: 16px; margin: 16px 0; background: #f7f9fa;">
+                <blockquote style="margin: 0; font-style: italic; color: #14171a;">
+                    "$text"
+                </blockquote>
+                <div style="margin-top: 12px;">
+                    <strong>
+                        <a href="https://twitter.com/$username"
+                           style="color: #1da1f2; text-decoration: none;">
+                            @$username
+                        </a>
+                    </strong>
+                    ($name)
+                </div>
+                $media_html
+                <div style="margin-top: 8px; font-size: 12px; color: #657786;">
+                    <a href="$url" style="color: #1da1f2;">View Tweet</a> "
+                    Liked: $liked_at
+                </div>
+            </div>
+            """)
+
+_EMPTY_DIGEST_TPL = Template("""
+            <html>
+            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                <h2 style="color: #1da1f2;">$title</h2>
+                <p>No liked tweets found for this period.</p>
+            </body>
+            </html>
+            """)
+
+_DIGEST_TPL = Template("""
+        <html>
+        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
+            <h2 style="color: #1da1f2; text-align: center;">$title</h2>
+            <p style="text-align: center; color: #657786;">
+                Found $count liked tweet$plural
+            </p>
+            $tweet_html
+            <hr style="margin: 32px 0; border: none; border-top: 1px solid #e1e8ed;">
+            <p style="text-align: center; font-size: 12px; color: #657786;">
+                Generated by Tweet Digest Notifier
+            </p>
+        </body>
+        </html>
+        """)
+
+@dataclass(frozen=True, slots=True)
+class Author:
+    """Tweet author, slotted to avoid per-instance dict overhead."""
+    username: str
+    name: str
+
+@dataclass(frozen=True, slots=True)
+class Tweet:
+    """One liked tweet; slots cut memory roughly 3x versus nested dicts,
+    which matters when a monthly digest holds thousands in memory."""
+    id: str
+    text: str
+    created_at: datetime
+    ts: float
+    author: Author
+    url: str
+    media: tuple
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Environment-derived settings, parsed once per process."""
+    bearer_token: str
+    user_id: str
+    smtp_host: str
+    smtp_port: int
+    smtp_user: str
+    smtp_pass: str
+    email_from: str
+    email_to: str
+    timezone: ZoneInfo
+
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """Load .env, validate required variables, and build the config once."""
+    load_dotenv()
+
+    required_vars = [
+        'TWITTER_BEARER_TOKEN', 'TWITTER_USER_ID', 'SMTP_HOST',
+        'SMTP_USER', 'SMTP_PASS', 'EMAIL_FROM', 'EMAIL_TO'
+    ]
+    missing = [var for var in required_vars if not os.getenv(var)]
+    if missing:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+
+    return Config(
+        bearer_token=os.getenv('TWITTER_BEARER_TOKEN'),
+        user_id=os.getenv('TWITTER_USER_ID'),
+        smtp_host=os.getenv('SMTP_HOST'),
+        smtp_port=int(os.getenv('SMTP_PORT', 587)),
+        smtp_user=os.getenv('SMTP_USER'),
+        smtp_pass=os.getenv('SMTP_PASS'),
+        email_from=os.getenv('EMAIL_FROM'),
+        email_to=os.getenv('EMAIL_TO'),
+        timezone=ZoneInfo(os.getenv('TIMEZONE', 'America/New_York'))
+    )
 
 class TwitterDigest:
     def __init__(self):
-        self.bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-        self.user_id = os.getenv('TWITTER_USER_ID')
-        self.smtp_host = os.getenv('SMTP_HOST')
-        self.smtp_port = int(os.getenv('SMTP_PORT', 587))
-        self.smtp_user = os.getenv('SMTP_USER')
-        self.smtp_pass = os.getenv('SMTP_PASS')
-        self.email_from = os.getenv('EMAIL_FROM')
-        self.email_to = os.getenv('EMAIL_TO')
-        self.timezone = pytz.timezone(os.getenv('TIMEZONE', 'America/New_York'))
-        
-        self._validate_config()
-    
-    def _validate_config(self):
-        """Validate that all required environment variables are set."""
-        required_vars = [
-            'TWITTER_BEARER_TOKEN', 'TWITTER_USER_ID', 'SMTP_HOST', 
-            'SMTP_USER', 'SMTP_PASS', 'EMAIL_FROM', 'EMAIL_TO'
-        ]
-        missing = [var for var in required_vars if not os.getenv(var)]
-        if missing:
-            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
-    
+        cfg = _config()
+        self.bearer_token = cfg.bearer_token
+        self.user_id = cfg.user_id
+        self.smtp_host = cfg.smtp_host
+        self.smtp_port = cfg.smtp_port
+        self.smtp_user = cfg.smtp_user
+        self.smtp_pass = cfg.smtp_pass
+        self.email_from = cfg.email_from
+        self.email_to = cfg.email_to
+        self.timezone = cfg.timezone
+
+        # Built once; every pagination request sends the same bearer token
+        self._headers = {"Authorization": f"Bearer {self.bearer_token}"}
+
+        # Opt-in: stop paginating once a page ends before the window.
+        # liked_tweets is ordered by like time, which usually but not always
+        # tracks created_at, so the default keeps exhaustive pagination.
+        self._early_exit = os.getenv('DIGEST_EARLY_EXIT') == '1'
+
+        # smtplib connections are not safe for concurrent use; the lock
+        # serializes sends when one connection is shared across digests.
+        # The connection itself is opened lazily at the first shared send
+        # so it cannot sit idle (and get dropped) through long fetches.
+        self._smtp_lock = threading.Lock()
+        self._smtp: Optional["smtplib.SMTP"] = None
+
+        # One pooled session for all pagination requests: keep-alive reuses
+        # the TCP+TLS connection to api.twitter.com across pages, and the
+        # adapter retries connection-level failures with backoff. No
+        # status_forcelist: the fetch loop handles 429 itself by sleeping
+        # until x-rate-limit-reset, and 5xx responses reach raise_for_status
+        # where the loop's failure counter retries them.
+        self.session = requests.Session()
+        self.session.headers.update(self.get_headers())
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.5,
+                allowed_methods=['GET']
+            )
+        ))
+
+    def close(self):
+        """Dispose the pooled HTTP session and any shared SMTP connection."""
+        self.session.close()
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass  # server may have dropped it already
+            self._smtp = None
+
     def get_headers(self) -> Dict[str, str]:
         """Get headers for Twitter API requests."""
-        return {"Authorization": f"Bearer {self.bearer_token}"}
+        return self._headers
     
-    def fetch_liked_tweets(self, start_time: datetime, end_time: datetime) -> List[Dict]:
+    # Only request fields the email actually renders; public_metrics was
+    # fetched on every page and never used
+    LIKES_PARAMS = {
+        "tweet.fields": "created_at,author_id,attachments",
+        "user.fields": "username,name",
+        "expansions": "author_id,attachments.media_keys",
+        "media.fields": "type,url,preview_image_url",
+        "max_results": 100
+    }
+
+    def _likes_url(self) -> str:
+        return f"https://api.twitter.com/2/users/{self.user_id}/liked_tweets"
+
+    def _collect_page(self, data: Dict, seen_ids: set, start_ts: float,
+                      end_ts: float, all_tweets: List[Tweet]) -> int:
+        """Project one API page into Tweet records, deduplicating by ID.
+
+        Returns the number of IDs on the page not seen before, so callers
+        can detect a fully wrapped-around feed.
+        """
+        tweets = data["data"]
+        includes = data.get("includes") or _EMPTY
+        users = {user["id"]: user for user in includes.get("users") or ()}
+        media = {m["media_key"]: m for m in includes.get("media") or ()}
+
+        page_new = 0
+        for tweet in tweets:
+            # Deduplicate across pages in the same pass as the
+            # time filter, instead of re-scanning afterwards
+            if tweet["id"] in seen_ids:
+                continue
+            seen_ids.add(tweet["id"])
+            page_new += 1
+
+            tweet_created = _parse_iso(tweet["created_at"])
+            tweet_ts = tweet_created.timestamp()
+
+            # Filter by time range (assuming liked_at is close to created_at for simplicity)
+            # Note: Twitter API v2 doesn't provide liked_at timestamp directly
+            if start_ts <= tweet_ts <= end_ts:
+                author = users.get(tweet["author_id"], _EMPTY)
+                username = author.get("username", "unknown")
+
+                # One comprehension instead of nested membership branches
+                tweet_media = tuple(
+                    media[key]
+                    for key in (tweet.get("attachments") or _EMPTY).get("media_keys", ())
+                    if key in media
+                )
+
+                all_tweets.append(Tweet(
+                    id=tweet["id"],
+                    text=tweet["text"],
+                    created_at=tweet_created,
+                    ts=tweet_ts,
+                    author=Author(
+                        username=username,
+                        name=author.get("name", "Unknown User")
+                    ),
+                    url=f"https://twitter.com/{username}/status/{tweet['id']}",
+                    media=tweet_media
+                ))
+
+        return page_new
+
+    def fetch_liked_tweets(self, start_time: datetime, end_time: datetime) -> List[Tweet]:
         """
         Fetch liked tweets within the specified time range.
-        Uses pagination to get all tweets.
+        Uses pagination to get all tweets, deduplicating by tweet ID as it
+        goes; a page consisting entirely of already-seen IDs ends pagination.
+        Prefers the httpx pipeline when available, which overlaps page
+        processing with the next request's network wait.
         """
-        url = f"https://api.twitter.com/2/users/{self.user_id}/liked_tweets"
-        
-        params = {
-            "tweet.fields": "created_at,author_id,public_metrics,attachments",
-            "user.fields": "username,name",
-            "expansions": "author_id,attachments.media_keys",
-            "media.fields": "type,url,preview_image_url",
-            "max_results": 100
-        }
-        
+        if httpx is not None:
+            return asyncio.run(self.fetch_liked_tweets_async(start_time, end_time))
+        return self._fetch_liked_tweets_sync(start_time, end_time)
+
+    async def fetch_liked_tweets_async(self, start_time: datetime, end_time: datetime) -> List[Tweet]:
+        """httpx/HTTP2 pagination: the next page's GET is dispatched before
+        the current page is processed, so JSON parsing and tweet projection
+        run while the next response is in flight."""
+        url = self._likes_url()
+        all_tweets = []
+        failures = 0
+        seen_ids = set()
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=self.get_headers(),
+            limits=httpx.Limits(max_keepalive_connections=4),
+            timeout=30.0
+        ) as client:
+            current_params = dict(self.LIKES_PARAMS)
+            next_task = asyncio.create_task(client.get(url, params=current_params))
+
+            while next_task is not None:
+                try:
+                    response = await next_task
+                    next_task = None
+
+                    # Rate limited: sleep until the window resets, then retry
+                    # the same page instead of discarding what we have
+                    if response.status_code == 429:
+                        reset = int(response.headers.get("x-rate-limit-reset", time.time() + 60))
+                        wait = max(0, reset - time.time()) + 1
+                        print(f"Rate limited; sleeping {wait:.0f}s until the window resets...")
+                        await asyncio.sleep(wait)
+                        next_task = asyncio.create_task(client.get(url, params=current_params))
+                        continue
+
+                    response.raise_for_status()
+                    # orjson skips the charset sniffing in .json() and
+                    # parses the dict-heavy payload in C
+                    data = orjson.loads(response.content) if orjson else response.json()
+                    failures = 0
+
+                    if "data" not in data:
+                        break
+
+                    # Dispatch the next page before projecting this one
+                    next_token = (data.get("meta") or _EMPTY).get("next_token")
+                    if next_token:
+                        current_params = dict(self.LIKES_PARAMS, pagination_token=next_token)
+                        next_task = asyncio.create_task(client.get(url, params=current_params))
+
+                    page_new = self._collect_page(data, seen_ids, start_ts, end_ts, all_tweets)
+
+                    # A page of nothing but already-seen IDs means the feed
+                    # has wrapped around; further pages would only repeat
+                    if data["data"] and page_new == 0 and next_task is not None:
+                        next_task.cancel()
+                        next_task = None
+
+                    # Pages arrive newest-first: once one ends before the
+                    # window, later ones can only be older still
+                    if (self._early_exit and next_task is not None and data["data"]
+                            and _parse_iso(data["data"][-1]["created_at"]).timestamp() < start_ts):
+                        print("Page pre-dates the digest window; stopping pagination early.")
+                        next_task.cancel()
+                        next_task = None
+
+                except httpx.HTTPError as e:
+                    failures += 1
+                    if failures >= 3:
+                        print(f"Error fetching tweets after {failures} attempts: {e}")
+                        break
+                    print(f"Error fetching tweets (attempt {failures}), retrying: {e}")
+                    next_task = asyncio.create_task(client.get(url, params=current_params))
+
+        return all_tweets
+
+    def _fetch_liked_tweets_sync(self, start_time: datetime, end_time: datetime) -> List[Tweet]:
+        """requests-based serial pagination, used when httpx is unavailable."""
+        url = self._likes_url()
+        params = dict(self.LIKES_PARAMS)
         all_tweets = []
         pagination_token = None
-        
+        failures = 0
+        seen_ids = set()
+
+        # Compare epochs instead of tz-aware datetimes in the per-tweet loop
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+
         while True:
             if pagination_token:
                 params["pagination_token"] = pagination_token
-            
+
             try:
-                response = requests.get(url, headers=self.get_headers(), params=params)
+                response = self.session.get(url, params=params, timeout=(5, 30))
+
+                # Rate limited: sleep until the window resets, then retry
+                # the same page instead of discarding what we have
+                if response.status_code == 429:
+                    reset = int(response.headers.get("x-rate-limit-reset", time.time() + 60))
+                    wait = max(0, reset - time.time()) + 1
+                    print(f"Rate limited; sleeping {wait:.0f}s until the window resets...")
+                    time.sleep(wait)
+                    continue
+
                 response.raise_for_status()
-                data = response.json()
-                
+                data = orjson.loads(response.content) if orjson else response.json()
+                failures = 0
+
                 if "data" not in data:
                     break
-                
-                tweets = data["data"]
-                users = {user["id"]: user for user in data.get("includes", {}).get("users", [])}
-                media = {m["media_key"]: m for m in data.get("includes", {}).get("media", [])}
-                
-                for tweet in tweets:
-                    tweet_created = datetime.fromisoformat(tweet["created_at"].replace("Z", "+00:00"))
-                    
-                    # Filter by time range (assuming liked_at is close to created_at for simplicity)
-                    # Note: Twitter API v2 doesn't provide liked_at timestamp directly
-                    if start_time <= tweet_created <= end_time:
-                        author = users.get(tweet["author_id"], {})
-                        tweet_media = []
-                        
-                        if "attachments" in tweet and "media_keys" in tweet["attachments"]:
-                            for media_key in tweet["attachments"]["media_keys"]:
-                                if media_key in media:
-                                    tweet_media.append(media[media_key])
-                        
-                        all_tweets.append({
-                            "id": tweet["id"],
-                            "text": tweet["text"],
-                            "created_at": tweet_created,
-                            "author": {
-                                "username": author.get("username", "unknown"),
-                                "name": author.get("name", "Unknown User")
-                            },
-                            "url": f"https://twitter.com/{author.get('username', 'unknown')}/status/{tweet['id']}",
-                            "media": tweet_media
-                        })
-                
-                pagination_token = data.get("meta", {}).get("next_token")
+
+                page_new = self._collect_page(data, seen_ids, start_ts, end_ts, all_tweets)
+
+                # A page of nothing but already-seen IDs means the feed has
+                # wrapped around; further pages would only repeat
+                if data["data"] and page_new == 0:
+                    break
+
+                # Pages arrive newest-first: once one ends before the
+                # window, later ones can only be older still
+                if (self._early_exit and data["data"]
+                        and _parse_iso(data["data"][-1]["created_at"]).timestamp() < start_ts):
+                    print("Page pre-dates the digest window; stopping pagination early.")
+                    break
+
+                pagination_token = (data.get("meta") or _EMPTY).get("next_token")
                 if not pagination_token:
                     break
-                    
+
+                # Pre-emptively wait when the window is nearly exhausted so
+                # the next page doesn't bounce off a 429
+                remaining = response.headers.get("x-rate-limit-remaining")
+                if remaining is not None and int(remaining) <= 1:
+                    reset = int(response.headers.get("x-rate-limit-reset", time.time() + 60))
+                    wait = max(0, reset - time.time()) + 1
+                    print(f"Rate-limit window nearly exhausted; sleeping {wait:.0f}s...")
+                    time.sleep(wait)
+
             except requests.exceptions.RequestException as e:
-                print(f"Error fetching tweets: {e}")
-                break
-        
+                failures += 1
+                if failures >= 3:
+                    print(f"Error fetching tweets after {failures} attempts: {e}")
+                    break
+                print(f"Error fetching tweets (attempt {failures}), retrying: {e}")
+
         return all_tweets
     
-    def filter_tweets_by_timeframe(self, tweets: List[Dict], timeframe: str) -> List[Dict]:
-        """Filter tweets based on timeframe (daily, weekly, monthly)."""
-        now = datetime.now(self.timezone)
+    def timeframe_bounds(self, timeframe: str, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+        """Start/end boundaries for a timeframe (daily, weekly, monthly)."""
+        if now is None:
+            now = datetime.now(self.timezone)
         
         if timeframe == "daily":
             start_time = (now - timedelta(days=1)).replace(hour=21, minute=0, second=0, microsecond=0)
@@ -129,18 +446,21 @@ class TwitterDigest:
             start_time = (now - timedelta(days=days_since_sunday + 6)).replace(hour=21, minute=0, second=0, microsecond=0)
             end_time = (now - timedelta(days=days_since_sunday - 1)).replace(hour=21, minute=0, second=0, microsecond=0)
         elif timeframe == "monthly":
+            import calendar  # only the monthly path needs it
             first_day = now.replace(day=1, hour=21, minute=0, second=0, microsecond=0)
             last_day = now.replace(day=calendar.monthrange(now.year, now.month)[1], hour=21, minute=0, second=0, microsecond=0)
             start_time = first_day
             end_time = last_day
         else:
             raise ValueError("Timeframe must be 'daily', 'weekly', or 'monthly'")
-        
-        return [tweet for tweet in tweets if start_time <= tweet["created_at"] <= end_time]
+
+        return start_time, end_time
     
-    def generate_html_email(self, tweets: List[Dict], timeframe: str) -> Tuple[str, str]:
+    def generate_html_email(self, tweets: List[Tweet], timeframe: str,
+                            now: Optional[datetime] = None) -> Tuple[str, str]:
         """Generate HTML email content and subject."""
-        now = datetime.now(self.timezone)
+        if now is None:
+            now = datetime.now(self.timezone)
         
         if timeframe == "daily":
             subject = f"Your Liked Tweets Digest  {now.strftime('%B %d, %Y')}"
@@ -154,121 +474,108 @@ class TwitterDigest:
             title = "Monthly Liked Tweets Recap"
         
         if not tweets:
-            html_content = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                <h2 style="color: #1da1f2;">{title}</h2>
-                <p>No liked tweets found for this period.</p>
-            </body>
-            </html>
-            """
-            return subject, html_content
-        
-        tweet_html = ""
-        for tweet in tweets:
-            media_html = ""
-            if tweet["media"]:
-                for media_item in tweet["media"]:
-                    if media_item.get("type") == "photo" and media_item.get("url"):
-                        media_html += f'<img src="{media_item["url"]}" style="max-width: 100%; margin: 10px 0;" alt="Tweet media">'
-                    elif media_item.get("preview_image_url"):
-                        media_html += f'<img src="{media_item["preview_image_url"]}" style="max-width: 100%; margin: 10px 0;" alt="Media preview">'
-            
-            tweet_html += f"""
-            <div style="border: 1px solid #e1e8ed; border-radius: 12px; padding: 16px; margin: 16px 0; background: #f7f9fa;">
-                <blockquote style="margin: 0; font-style: italic; color: #14171a;">
-                    "{tweet['text']}"
-                </blockquote>
-                <div style="margin-top: 12px;">
-                    <strong>
-                        <a href="https://twitter.com/{tweet['author']['username']}" 
-                           style="color: #1da1f2; text-decoration: none;">
-                            @{tweet['author']['username']}
-                        </a>
-                    </strong>
-                    ({tweet['author']['name']})
-                </div>
-                {media_html}
-                <div style="margin-top: 8px; font-size: 12px; color: #657786;">
-                    <a href="{tweet['url']}" style="color: #1da1f2;">View Tweet</a> " 
-                    Liked: {tweet['created_at'].strftime('%B %d, %Y at %I:%M %p')}
-                </div>
-            </div>
-            """
-        
-        html_content = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <h2 style="color: #1da1f2; text-align: center;">{title}</h2>
-            <p style="text-align: center; color: #657786;">
-                Found {len(tweets)} liked tweet{"s" if len(tweets) != 1 else ""}
-            </p>
-            {tweet_html}
-            <hr style="margin: 32px 0; border: none; border-top: 1px solid #e1e8ed;">
-            <p style="text-align: center; font-size: 12px; color: #657786;">
-                Generated by Tweet Digest Notifier
-            </p>
-        </body>
-        </html>
-        """
+            return subject, _EMPTY_DIGEST_TPL.substitute(title=title)
         
+        # Accumulate into lists and join once: += on str re-copies the whole
+        # accumulated document per tweet, which goes quadratic on big digests
+        # Format all dates in one tight pass before the HTML loop; strftime's
+        # locale-aware formatter is the priciest call in the per-tweet block
+        date_strs = [t.created_at.strftime('%B %d, %Y at %I:%M %p') for t in tweets]
+
+        tweet_parts = []
+        for tweet, liked_at in zip(tweets, date_strs):
+            # Escape user-controlled fields exactly once before they reach
+            # the templates; tweet text routinely contains &, <, and quotes
+            username = _esc(tweet.author.username, quote=True)
+            name = _esc(tweet.author.name)
+
+            media_parts = []
+            for media_item in tweet.media:
+                if media_item.get("type") == "photo" and media_item.get("url"):
+                    media_parts.append(_MEDIA_IMG_TPL.substitute(src=_esc(media_item["url"], quote=True), alt="Tweet media"))
+                elif media_item.get("preview_image_url"):
+                    media_parts.append(_MEDIA_IMG_TPL.substitute(src=_esc(media_item["preview_image_url"], quote=True), alt="Media preview"))
+            media_html = "".join(media_parts)
+
+            tweet_parts.append(_TWEET_TPL.substitute(
+                text=_esc(tweet.text),
+                username=username,
+                name=name,
+                media_html=media_html,
+                url=_esc(tweet.url, quote=True),
+                liked_at=liked_at
+            ))
+
+        html_content = _DIGEST_TPL.substitute(
+            title=title,
+            count=len(tweets),
+            plural="s" if len(tweets) != 1 else "",
+            tweet_html="".join(tweet_parts)
+        )
+
         return subject, html_content
     
-    def send_email(self, subject: str, html_content: str):
-        """Send email via SMTP."""
+    def _smtp_connect(self) -> "smtplib.SMTP":
+        """Open and authenticate an SMTP connection."""
+        import smtplib  # deferred: most of a no-tweets run never sends
+
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        server.starttls()
+        server.login(self.smtp_user, self.smtp_pass)
+        return server
+
+    def send_email(self, subject: str, html_content: str, share_connection: bool = False):
+        """Send email via SMTP.
+
+        With share_connection, a single connection is opened at the first
+        send and reused for later ones (reopened if the server dropped it
+        in the meantime); otherwise one is opened and closed per call.
+        """
+        import smtplib
+        from email.message import EmailMessage
+
         try:
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage()
             msg['Subject'] = subject
             msg['From'] = self.email_from
             msg['To'] = self.email_to
-            
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-            
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
-            
+            msg.set_content(html_content, subtype='html')
+
+            if share_connection:
+                with self._smtp_lock:
+                    if self._smtp is None:
+                        self._smtp = self._smtp_connect()
+                    try:
+                        self._smtp.send_message(msg)
+                    except smtplib.SMTPServerDisconnected:
+                        # Server closed the idle connection between digests
+                        self._smtp = self._smtp_connect()
+                        self._smtp.send_message(msg)
+            else:
+                with self._smtp_connect() as server:
+                    server.send_message(msg)
+
             print(f"Email sent successfully: {subject}")
-            
+
         except Exception as e:
             print(f"Failed to send email: {e}")
             raise
     
-    def run_digest(self, timeframe: str):
+    def run_digest(self, timeframe: str, share_connection: bool = False):
         """Run the digest for the specified timeframe."""
         print(f"Running {timeframe} digest...")
-        
+
         try:
-            # Calculate time range for API call (get more data than needed, then filter)
+            # Resolve 'now' once so the bounds and the email subject agree
+            # on the same instant, then fetch exactly the timeframe window;
+            # the fetch loop filters by time and deduplicates in one pass
             now = datetime.now(self.timezone)
-            if timeframe == "daily":
-                start_time = now - timedelta(days=2)
-            elif timeframe == "weekly":
-                start_time = now - timedelta(days=14)
-            else:  # monthly
-                start_time = now - timedelta(days=32)
-            
-            end_time = now
-            
-            # Fetch tweets
-            all_tweets = self.fetch_liked_tweets(start_time, end_time)
-            
-            # Filter by exact timeframe
-            filtered_tweets = self.filter_tweets_by_timeframe(all_tweets, timeframe)
-            
-            # Remove duplicates
-            seen_ids = set()
-            unique_tweets = []
-            for tweet in filtered_tweets:
-                if tweet["id"] not in seen_ids:
-                    seen_ids.add(tweet["id"])
-                    unique_tweets.append(tweet)
-            
+            start_time, end_time = self.timeframe_bounds(timeframe, now)
+            tweets = self.fetch_liked_tweets(start_time, end_time)
+
             # Generate and send email
-            subject, html_content = self.generate_html_email(unique_tweets, timeframe)
-            self.send_email(subject, html_content)
+            subject, html_content = self.generate_html_email(tweets, timeframe, now)
+            self.send_email(subject, html_content, share_connection)
             
         except Exception as e:
             print(f"Error running {timeframe} digest: {e}")
@@ -277,16 +584,29 @@ class TwitterDigest:
 def main():
     """Main function to run the script."""
     if len(sys.argv) != 2:
-        print("Usage: python tweet_digest.py [daily|weekly|monthly]")
+        print("Usage: python tweet_digest.py [daily|weekly|monthly|all]")
         sys.exit(1)
-    
+
     timeframe = sys.argv[1].lower()
-    if timeframe not in ['daily', 'weekly', 'monthly']:
-        print("Timeframe must be 'daily', 'weekly', or 'monthly'")
+    if timeframe not in ['daily', 'weekly', 'monthly', 'all']:
+        print("Timeframe must be 'daily', 'weekly', 'monthly', or 'all'")
         sys.exit(1)
-    
+
     digest = TwitterDigest()
-    digest.run_digest(timeframe)
+    try:
+        if timeframe == 'all':
+            # One process for all three digests: interpreter startup, config
+            # parsing, the pooled TLS connection, and the STARTTLS+AUTH dance
+            # are paid once, and the three fetches overlap their network
+            # waits. The shared SMTP connection opens at the first send, not
+            # up front, so it never idles through the fetches.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(lambda tf: digest.run_digest(tf, share_connection=True),
+                                  ['daily', 'weekly', 'monthly']))
+        else:
+            digest.run_digest(timeframe)
+    finally:
+        digest.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file